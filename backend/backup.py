@@ -0,0 +1,69 @@
+"""Back up or restore all collections as a gzip-compressed NDJSON archive.
+
+Usage (from the project root):
+    python -m backend.backup backup --out backup.ndjson.gz
+    python -m backend.backup restore backup.ndjson.gz --batch-size 1000 --parallelism 4 --drop
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from backend.server import (
+    BACKUP_BATCH_SIZE,
+    BACKUP_CHUNK_BYTES,
+    BACKUP_PARALLELISM,
+    RestoreError,
+    iter_backup_chunks,
+    restore_backup,
+)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+async def write_backup(path: Path):
+    with open(path, "wb") as f:
+        async for chunk in iter_backup_chunks():
+            f.write(chunk)
+
+
+async def read_chunks(path: Path):
+    with open(path, "rb") as f:
+        while chunk := f.read(BACKUP_CHUNK_BYTES):
+            yield chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Back up or restore portfolio data")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backup_parser = commands.add_parser("backup", help="Write all collections to an archive")
+    backup_parser.add_argument("--out", type=Path, default=Path("backup.ndjson.gz"), help="Archive path")
+
+    restore_parser = commands.add_parser("restore", help="Load an archive into the database")
+    restore_parser.add_argument("archive", type=Path, help="Archive path")
+    restore_parser.add_argument("--batch-size", type=positive_int, default=BACKUP_BATCH_SIZE)
+    restore_parser.add_argument("--parallelism", type=positive_int, default=BACKUP_PARALLELISM)
+    restore_parser.add_argument("--drop", action="store_true",
+                                help="Replace collections with the archive contents instead of upserting by id")
+
+    args = parser.parse_args()
+    if args.command == "backup":
+        asyncio.run(write_backup(args.out))
+        print(f"Backup written to {args.out}")
+    else:
+        try:
+            counts = asyncio.run(restore_backup(read_chunks(args.archive), args.batch_size, args.parallelism, args.drop))
+        except RestoreError as e:
+            print(f"Restore failed: {e} (committed: {e.committed})", file=sys.stderr)
+            sys.exit(1)
+        print(f"Restored {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Full rebuild of the static public API files.
+
+Usage (from the project root):
+    python -m backend.export_static                       # writes to STATIC_EXPORT_DIR
+    python -m backend.export_static --out frontend/public/data
+
+The frontend `vercel-build` script runs this before `craco build` so the files
+ship with the static build, and only enables the static-first reads in the
+frontend (REACT_APP_STATIC_DATA) when the export succeeded. The export refuses
+to run against the mock database unless --allow-mock is given, so placeholder
+data is never published in place of the real content.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from backend.server import STATIC_EXPORT_DIR, MockAsyncIOMotorClient, client, export_all
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export public portfolio, articles and gallery to static JSON")
+    parser.add_argument("--out", type=Path, default=STATIC_EXPORT_DIR, help="Output directory")
+    parser.add_argument("--allow-mock", action="store_true", help="Export even when no MongoDB is configured")
+    args = parser.parse_args()
+    if isinstance(client, MockAsyncIOMotorClient) and not args.allow_mock:
+        print("Static export skipped: no MongoDB configured (pass --allow-mock to export mock data)", file=sys.stderr)
+        sys.exit(1)
+    asyncio.run(export_all(args.out))
+    print(f"Static export written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
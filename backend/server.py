@@ -1,13 +1,25 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne
+from pymongo.errors import PyMongoError
 import os
+import json
+import time
+import asyncio
+import hashlib
+import zlib
 import logging
+import urllib.request
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 import uuid
 from datetime import datetime, timezone, timedelta
 import secrets
@@ -46,29 +58,33 @@ class MockDatabase:
     def __getitem__(self, key):
         if key not in self.data:
             self.data[key] = []
-        return MockCollection(self.data[key])
+        return MockCollection(self.data[key], self.data, key)
     
     def __getattr__(self, key):
         return self[key]
 
 class MockCollection:
-    def __init__(self, collection_data):
+    def __init__(self, collection_data, database=None, name=None):
         self.collection_data = collection_data
+        self.database = database
+        self.name = name
     
+    @staticmethod
+    def matches(doc, query):
+        # Simple mock: only plain equality filters are supported
+        return all(doc.get(k) == v for k, v in (query or {}).items())
+
     async def find_one(self, query=None, *args, **kwargs):
-        if not self.collection_data:
-            return None
-        # Simple mock: return first item or None
-        return self.collection_data[0] if self.collection_data else None
+        return next((doc for doc in self.collection_data if self.matches(doc, query)), None)
 
     def find(self, query=None, *args, **kwargs):
-        return MockCursor(self.collection_data)
+        return MockCursor([doc for doc in self.collection_data if self.matches(doc, query)])
 
     async def insert_one(self, doc):
         self.collection_data.append(doc)
         return True
 
-    async def insert_many(self, docs):
+    async def insert_many(self, docs, *args, **kwargs):
         self.collection_data.extend(docs)
         return True
         
@@ -99,16 +115,44 @@ class MockCollection:
     async def count_documents(self, query):
         return len(self.collection_data)
 
+    async def bulk_write(self, requests, *args, **kwargs):
+        # Only ReplaceOne is used (by restore); match on the filter's fields
+        for request in requests:
+            query, doc = request._filter, request._doc
+            for i, existing in enumerate(self.collection_data):
+                if self.matches(existing, query):
+                    self.collection_data[i] = doc
+                    break
+            else:
+                self.collection_data.append(doc)
+        return True
+
+    async def drop(self):
+        self.database.pop(self.name, None)
+
+    async def rename(self, new_name, dropTarget=False):
+        self.database[new_name] = self.database.pop(self.name)
+
 class MockCursor:
     def __init__(self, data):
         self.data = data
     
     def sort(self, *args, **kwargs):
         return self
+
+    def batch_size(self, *args, **kwargs):
+        return self
         
     async def to_list(self, length):
         return self.data[:length]
 
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in list(self.data):
+            yield doc
+
 try:
     mongo_url = os.environ.get('MONGO_URL', '')
     if not mongo_url or "localhost" in mongo_url:
@@ -147,6 +191,32 @@ ADMIN_PASSWORD = "Miryam07_"
 # Session storage (in-memory for simplicity)
 active_sessions = {}
 
+# AI chat cache and concurrency limits
+AI_CACHE_TTL_SECONDS = float(os.environ.get('AI_CACHE_TTL_SECONDS', '300'))
+AI_CACHE_MAX_ENTRIES = int(os.environ.get('AI_CACHE_MAX_ENTRIES', '256'))
+AI_MAX_CONCURRENCY = int(os.environ.get('AI_MAX_CONCURRENCY', '4'))
+AI_QUEUE_TIMEOUT_SECONDS = float(os.environ.get('AI_QUEUE_TIMEOUT_SECONDS', '2'))
+AI_UPSTREAM_TIMEOUT_SECONDS = float(os.environ.get('AI_UPSTREAM_TIMEOUT_SECONDS', '30'))
+
+# Public write admission control. Rate limits are "<burst>/<seconds>" per client IP.
+RATE_LIMITS = {
+    "like": os.environ.get('RATE_LIMIT_LIKE', '20/60'),
+    "comment": os.environ.get('RATE_LIMIT_COMMENT', '5/60'),
+}
+RATE_LIMIT_MAX_CLIENTS = int(os.environ.get('RATE_LIMIT_MAX_CLIENTS', '10000'))
+RATE_LIMIT_IDLE_SECONDS = float(os.environ.get('RATE_LIMIT_IDLE_SECONDS', '600'))
+WRITE_MAX_INFLIGHT = int(os.environ.get('WRITE_MAX_INFLIGHT', '50'))
+WRITE_MAX_DB_LATENCY_MS = float(os.environ.get('WRITE_MAX_DB_LATENCY_MS', '500'))
+# Number of trusted reverse proxies in front of the app that append to
+# X-Forwarded-For. 0 ignores the header and uses the socket peer address.
+TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS', '0'))
+
+# Backup / restore
+BACKUP_COLLECTIONS = ["portfolio", "tasks", "articles", "gallery", "ai_memory", "notifications"]
+BACKUP_BATCH_SIZE = int(os.environ.get('BACKUP_BATCH_SIZE', '1000'))
+BACKUP_PARALLELISM = int(os.environ.get('BACKUP_PARALLELISM', '4'))
+BACKUP_CHUNK_BYTES = 64 * 1024
+
 # ==================== MODELS ====================
 
 class LoginRequest(BaseModel):
@@ -345,6 +415,424 @@ async def init_default_data():
         ]
         await db.gallery.insert_many(placeholder_photos)
 
+# ==================== STATIC EXPORT ====================
+
+# Public responses are rendered to JSON files next to the frontend build so the
+# CDN can serve anonymous traffic without invoking the Python function. The full
+# export runs during the frontend build (see `vercel-build` in frontend/package.json).
+# Per-write regeneration only helps when the API and the served static files share
+# a writable filesystem (e.g. a self-hosted server serving frontend/build); on
+# Vercel the function cannot write to the CDN output, so it is off by default.
+STATIC_EXPORT_DIR = Path(os.environ.get('STATIC_EXPORT_DIR', ROOT_DIR.parent / 'frontend' / 'build' / 'data'))
+STATIC_EXPORT_ENABLED = os.environ.get('STATIC_EXPORT_ENABLED', 'false').lower() == 'true'
+# Optional deploy hook (e.g. a Vercel Deploy Hook) that re-runs the frontend build,
+# and with it the full export, after admin content changes.
+STATIC_REBUILD_HOOK_URL = os.environ.get('STATIC_REBUILD_HOOK_URL', '')
+
+def write_static_file(relative_path: str, payload: Any, out_dir: Optional[Path] = None):
+    """Atomically write a JSON payload to the export directory"""
+    target = (out_dir or STATIC_EXPORT_DIR) / relative_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(json.dumps(jsonable_encoder(payload), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, target)
+
+def remove_static_file(relative_path: str, out_dir: Optional[Path] = None):
+    target = (out_dir or STATIC_EXPORT_DIR) / relative_path
+    if target.exists():
+        target.unlink()
+
+async def export_portfolio(out_dir: Optional[Path] = None):
+    write_static_file("portfolio.json", await get_portfolio(), out_dir)
+
+async def export_gallery(out_dir: Optional[Path] = None):
+    write_static_file("gallery.json", await get_gallery(visible_only=True), out_dir)
+
+async def export_articles(article_id: Optional[str] = None, out_dir: Optional[Path] = None):
+    """Export the published articles list, plus one article (or all of them when no id is given)"""
+    write_static_file("articles.json", await get_articles(published_only=True), out_dir)
+    # Per-article files are queried directly; the list endpoint is capped at 100 articles
+    if article_id is None:
+        async for article in db.articles.find({"published": True}, {"_id": 0}):
+            write_static_file(f"articles/{article['id']}.json", article, out_dir)
+        return
+    article = await db.articles.find_one({"id": article_id, "published": True}, {"_id": 0})
+    if article:
+        write_static_file(f"articles/{article_id}.json", article, out_dir)
+    else:
+        # Unpublished or deleted articles must not stay reachable on the CDN
+        remove_static_file(f"articles/{article_id}.json", out_dir)
+
+async def export_all(out_dir: Optional[Path] = None):
+    """Full rebuild of every public static file"""
+    target = out_dir or STATIC_EXPORT_DIR
+    articles_dir = target / "articles"
+    if articles_dir.exists():
+        for stale in articles_dir.glob("*.json"):
+            stale.unlink()
+    await export_portfolio(out_dir)
+    await export_articles(out_dir=out_dir)
+    await export_gallery(out_dir)
+
+def trigger_static_rebuild():
+    request = urllib.request.Request(STATIC_REBUILD_HOOK_URL, method="POST")
+    with urllib.request.urlopen(request, timeout=5):
+        pass
+
+async def refresh_static(exporter, *args):
+    """Regenerate affected static files after a write; never fails the request"""
+    try:
+        if STATIC_EXPORT_ENABLED:
+            await exporter(*args)
+        if STATIC_REBUILD_HOOK_URL:
+            await asyncio.to_thread(trigger_static_rebuild)
+    except Exception as e:
+        logging.warning(f"Static export failed ({exporter.__name__}): {str(e)}")
+
+# ==================== AI RESPONSE CACHE ====================
+
+class AIBusyError(Exception):
+    """Raised when no upstream LLM slot frees up within the queue timeout"""
+
+class AIResponseCache:
+    """TTL + LRU cache for AI chat responses that coalesces identical in-flight requests"""
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()
+        self.inflight = {}
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def get_or_compute(self, key, compute):
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        pending = self.inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._compute(key, compute))
+            self.inflight[key] = pending
+        # Shield so one cancelled caller does not cancel the call shared by the others
+        return await asyncio.shield(pending)
+
+    async def _compute(self, key, compute):
+        try:
+            value = await compute()
+            self.set(key, value)
+            return value
+        finally:
+            self.inflight.pop(key, None)
+
+ai_response_cache = AIResponseCache(AI_CACHE_MAX_ENTRIES, AI_CACHE_TTL_SECONDS)
+ai_semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+# Bumped whenever stored memories or tasks change so cached answers built on
+# stale context are never served. Conversation logs written by the chat
+# endpoint itself deliberately do not bump the memory version.
+context_versions = {"memory": 0, "tasks": 0}
+
+def bump_context_version(name: str):
+    context_versions[name] += 1
+
+def normalize_ai_message(text: str) -> str:
+    return " ".join(text.lower().split())
+
+def ai_cache_key(text: str) -> str:
+    raw = f"{normalize_ai_message(text)}|m{context_versions['memory']}|t{context_versions['tasks']}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def release_if_acquired(acquire: asyncio.Future):
+    if not acquire.cancelled() and acquire.exception() is None:
+        ai_semaphore.release()
+
+async def acquire_ai_slot():
+    """Wait up to AI_QUEUE_TIMEOUT_SECONDS for a limiter slot.
+
+    wait_for() can time out after acquire() has already succeeded, leaking the
+    permit, so the acquire runs as its own task and a late success is released.
+    """
+    acquire = asyncio.ensure_future(ai_semaphore.acquire())
+    try:
+        await asyncio.wait({acquire}, timeout=AI_QUEUE_TIMEOUT_SECONDS)
+    finally:
+        # Also runs when the caller itself is cancelled while waiting
+        pending = not acquire.done()
+        if pending:
+            acquire.cancel()
+            acquire.add_done_callback(release_if_acquired)
+    if pending:
+        raise AIBusyError("AI assistant is at capacity")
+
+async def send_llm_message(system_prompt: str, text: str) -> str:
+    """Call the upstream LLM, bounded by the concurrency limiter and timeouts"""
+    await acquire_ai_slot()
+    try:
+        chat = LlmChat(
+            api_key=EMERGENT_LLM_KEY,
+            session_id=str(uuid.uuid4()),
+            system_message=system_prompt
+        ).with_model("openai", "gpt-4.1-mini")
+        return await asyncio.wait_for(
+            chat.send_message(UserMessage(text=text)),
+            timeout=AI_UPSTREAM_TIMEOUT_SECONDS
+        )
+    finally:
+        ai_semaphore.release()
+
+# ==================== ADMISSION CONTROL ====================
+
+class TokenBucketLimiter:
+    """Per-key token buckets kept in an LRU map that drops idle and overflow entries"""
+    def __init__(self, max_keys: int, idle_seconds: float):
+        self.max_keys = max_keys
+        self.idle_seconds = idle_seconds
+        self.buckets = OrderedDict()
+
+    def acquire(self, key, capacity: float, refill_per_second: float) -> float:
+        """Take one token; returns 0 when allowed, else the seconds until a token is available"""
+        now = time.monotonic()
+        self._evict(now)
+        tokens, updated_at = self.buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / refill_per_second
+        self.buckets[key] = (tokens, now)
+        return retry_after
+
+    def _evict(self, now: float):
+        # Buckets are kept in access order, so idle ones sit at the front
+        while self.buckets:
+            _, updated_at = next(iter(self.buckets.values()))
+            if len(self.buckets) < self.max_keys and now - updated_at < self.idle_seconds:
+                break
+            self.buckets.popitem(last=False)
+
+class WriteBackpressure:
+    """Tracks in-flight public writes and smoothed DB write latency"""
+    RECOVERY_SECONDS = 5.0
+
+    def __init__(self, max_inflight: int, max_latency_ms: float):
+        self.max_inflight = max_inflight
+        self.max_latency_ms = max_latency_ms
+        self.inflight = 0
+        self.latency_ms = 0.0
+        self.last_sample_at = 0.0
+
+    def overloaded(self) -> bool:
+        if self.inflight >= self.max_inflight:
+            return True
+        # A stale latency reading is ignored so rejected writes cannot keep the gate shut forever
+        recent = time.monotonic() - self.last_sample_at < self.RECOVERY_SECONDS
+        return recent and self.latency_ms > self.max_latency_ms
+
+    @asynccontextmanager
+    async def track(self):
+        self.inflight += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.inflight -= 1
+            self.last_sample_at = time.monotonic()
+            elapsed_ms = (self.last_sample_at - started) * 1000
+            self.latency_ms = elapsed_ms if self.latency_ms == 0 else 0.8 * self.latency_ms + 0.2 * elapsed_ms
+
+rate_limiter = TokenBucketLimiter(RATE_LIMIT_MAX_CLIENTS, RATE_LIMIT_IDLE_SECONDS)
+write_backpressure = WriteBackpressure(WRITE_MAX_INFLIGHT, WRITE_MAX_DB_LATENCY_MS)
+
+def parse_rate_limit(spec: str):
+    burst, seconds = spec.split("/")
+    return float(burst), float(burst) / float(seconds)
+
+def get_client_ip(request: Request) -> str:
+    """Client address for rate limiting.
+
+    Left-most X-Forwarded-For entries are client-controlled, so only the entry
+    appended by the outermost trusted proxy is used.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if TRUSTED_PROXY_HOPS <= 0:
+        return peer
+    forwarded = [ip.strip() for ip in request.headers.get("x-forwarded-for", "").split(",") if ip.strip()]
+    if len(forwarded) < TRUSTED_PROXY_HOPS:
+        return peer
+    return forwarded[-TRUSTED_PROXY_HOPS]
+
+def public_write_admission(route: str):
+    """Dependency that rejects writes from noisy clients (429) or while the DB is overloaded (503)"""
+    capacity, refill_per_second = parse_rate_limit(RATE_LIMITS[route])
+
+    async def admit(request: Request):
+        retry_after = rate_limiter.acquire((route, get_client_ip(request)), capacity, refill_per_second)
+        if retry_after:
+            raise HTTPException(status_code=429, detail="Too many requests", headers={"Retry-After": str(int(retry_after) + 1)})
+        if write_backpressure.overloaded():
+            raise HTTPException(status_code=503, detail="Server busy, please retry shortly", headers={"Retry-After": "1"})
+        return True
+    return admit
+
+# ==================== BACKUP / RESTORE ====================
+
+# Archives are gzip-compressed NDJSON, one {"collection": ..., "doc": ...} object per line.
+
+async def iter_backup_chunks() -> AsyncIterator[bytes]:
+    """Stream every collection as compressed NDJSON without loading a collection into memory"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    buffer = []
+    buffered = 0
+    for name in BACKUP_COLLECTIONS:
+        async for doc in db[name].find({}, {"_id": 0}).batch_size(BACKUP_BATCH_SIZE):
+            line = json.dumps({"collection": name, "doc": doc}, default=str).encode("utf-8") + b"\n"
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= BACKUP_CHUNK_BYTES:
+                chunk = compressor.compress(b"".join(buffer))
+                buffer, buffered = [], 0
+                if chunk:
+                    yield chunk
+    yield compressor.compress(b"".join(buffer)) + compressor.flush()
+
+async def iter_backup_records(chunks: AsyncIterator[bytes]):
+    """Yield archive records, raising ValueError for empty or truncated archives"""
+    decompressor = zlib.decompressobj(47)  # accepts gzip or zlib headers
+    pending = b""
+    records = 0
+    async for chunk in chunks:
+        pending += decompressor.decompress(chunk)
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                records += 1
+                yield json.loads(line)
+    pending += decompressor.flush()
+    if not decompressor.eof:
+        raise ValueError("Backup archive is empty or truncated")
+    if pending.strip():
+        records += 1
+        yield json.loads(pending)
+    if records == 0:
+        raise ValueError("Backup archive contains no records")
+
+class RestoreError(Exception):
+    """Raised when a restore fails; `committed` holds the per-collection counts already written"""
+    def __init__(self, message: str, committed: Dict[str, int], status_code: int):
+        super().__init__(message)
+        self.committed = committed
+        self.status_code = status_code
+
+# Singleton collections are replaced as a whole rather than matched by `id`
+BACKUP_SINGLETON_COLLECTIONS = {"portfolio"}
+
+def restore_staging_name(name: str) -> str:
+    return f"{name}__restore"
+
+def restore_filter(name: str, doc: dict) -> dict:
+    return {} if name in BACKUP_SINGLETON_COLLECTIONS else {"id": doc["id"]}
+
+async def restore_backup(chunks: AsyncIterator[bytes], batch_size: int = BACKUP_BATCH_SIZE,
+                         parallelism: int = BACKUP_PARALLELISM, drop: bool = False) -> Dict[str, int]:
+    """Restore an archive with batched bulk writes, at most `parallelism` in flight.
+
+    Without `drop`, documents are upserted by `id` so existing data is never duplicated.
+    With `drop`, documents are loaded into staging collections that replace the live
+    ones only after the whole archive has been read and written successfully.
+    """
+    if drop:
+        for name in BACKUP_COLLECTIONS:
+            await db[restore_staging_name(name)].drop()
+
+    slots = asyncio.Semaphore(parallelism)
+    inflight = set()
+    written = {}
+    batches = {}
+
+    async def write_batch(name, docs):
+        try:
+            if drop:
+                await db[restore_staging_name(name)].insert_many(docs, ordered=False)
+            else:
+                await db[name].bulk_write(
+                    [ReplaceOne(restore_filter(name, doc), doc, upsert=True) for doc in docs],
+                    ordered=False
+                )
+            written[name] = written.get(name, 0) + len(docs)
+        finally:
+            slots.release()
+
+    async def flush(name):
+        docs = batches.pop(name, [])
+        if not docs:
+            return
+        await slots.acquire()
+        task = asyncio.ensure_future(write_batch(name, docs))
+        inflight.add(task)
+        task.add_done_callback(inflight.discard)
+
+    error = None
+    try:
+        async for record in iter_backup_records(chunks):
+            name = record.get("collection")
+            doc = record.get("doc")
+            if name not in BACKUP_COLLECTIONS:
+                raise ValueError(f"Unknown collection in backup: {name}")
+            if not isinstance(doc, dict) or (name not in BACKUP_SINGLETON_COLLECTIONS and "id" not in doc):
+                raise ValueError(f"Document without an id in {name}")
+            batches.setdefault(name, []).append(doc)
+            if len(batches[name]) >= batch_size:
+                await flush(name)
+        for name in list(batches):
+            await flush(name)
+    except Exception as e:
+        error = e
+    results = await asyncio.gather(*inflight, return_exceptions=True)
+    error = error or next((r for r in results if isinstance(r, Exception)), None)
+
+    committed = {}
+    if drop:
+        try:
+            if error is None:
+                for name in BACKUP_COLLECTIONS:
+                    if name in written:
+                        await db[restore_staging_name(name)].rename(name, dropTarget=True)
+                    else:
+                        await db[name].delete_many({})
+                    committed[name] = written.get(name, 0)
+        except PyMongoError as e:
+            error = e
+        finally:
+            for name in BACKUP_COLLECTIONS:
+                if name not in committed:
+                    await db[restore_staging_name(name)].drop()
+    else:
+        committed = dict(written)
+
+    if committed:
+        bump_context_version("memory")
+        bump_context_version("tasks")
+        await refresh_static(export_all)
+    if error is not None:
+        status_code = 400 if isinstance(error, (ValueError, KeyError, TypeError, zlib.error)) else 500
+        raise RestoreError(str(error), committed, status_code) from error
+    return committed
+
 # ==================== AUTH ROUTES ====================
 
 @api_router.post("/auth/login", response_model=LoginResponse)
@@ -381,6 +869,7 @@ async def get_portfolio():
 async def update_portfolio(portfolio_data: dict, _: bool = Depends(get_current_admin)):
     portfolio_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     await db.portfolio.update_one({}, {"$set": portfolio_data}, upsert=True)
+    await refresh_static(export_portfolio)
     return {"success": True, "message": "Portfolio updated"}
 
 # ==================== TASKS ROUTES ====================
@@ -402,17 +891,20 @@ async def create_task(task: TaskCreate, _: bool = Depends(get_current_admin)):
     if doc['reminder_time']:
         doc['reminder_time'] = doc['reminder_time'].isoformat() if isinstance(doc['reminder_time'], datetime) else doc['reminder_time']
     await db.tasks.insert_one(doc)
+    bump_context_version("tasks")
     return {"success": True, "task": doc}
 
 @api_router.put("/tasks/{task_id}")
 async def update_task(task_id: str, task_data: dict, _: bool = Depends(get_current_admin)):
     task_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     await db.tasks.update_one({"id": task_id}, {"$set": task_data})
+    bump_context_version("tasks")
     return {"success": True, "message": "Task updated"}
 
 @api_router.delete("/tasks/{task_id}")
 async def delete_task(task_id: str, _: bool = Depends(get_current_admin)):
     await db.tasks.delete_one({"id": task_id})
+    bump_context_version("tasks")
     return {"success": True, "message": "Task deleted"}
 
 # ==================== AI AGENT ROUTES ====================
@@ -427,21 +919,24 @@ async def save_ai_memory(memory: dict, _: bool = Depends(get_current_admin)):
     memory['id'] = str(uuid.uuid4())
     memory['created_at'] = datetime.now(timezone.utc).isoformat()
     await db.ai_memory.insert_one(memory)
+    bump_context_version("memory")
     return {"success": True, "memory": memory}
 
 @api_router.delete("/ai/memory/{memory_id}")
 async def delete_ai_memory(memory_id: str, _: bool = Depends(get_current_admin)):
     await db.ai_memory.delete_one({"id": memory_id})
+    bump_context_version("memory")
     return {"success": True, "message": "Memory deleted"}
 
 @api_router.delete("/ai/memory")
 async def clear_ai_memory(_: bool = Depends(get_current_admin)):
     await db.ai_memory.delete_many({})
+    bump_context_version("memory")
     return {"success": True, "message": "All memories cleared"}
 
 @api_router.post("/ai/chat")
 async def chat_with_ai(message: AIMessage, _: bool = Depends(get_current_admin)):
-    try:
+    async def generate_response():
         # Get memories for context
         memories = await db.ai_memory.find({}, {"_id": 0}).sort("created_at", -1).to_list(20)
         memory_context = "\n".join([f"- {m.get('content', '')}" for m in memories])
@@ -472,14 +967,11 @@ Guidelines:
 - You can help with creating new tasks, notes, and reminders"""
 
         # Use Emergent LLM Integration
-        session_id = str(uuid.uuid4())
-        chat = LlmChat(
-            api_key=EMERGENT_LLM_KEY,
-            session_id=session_id,
-            system_message=system_prompt
-        ).with_model("openai", "gpt-4.1-mini")
-        
-        ai_response = await chat.send_message(UserMessage(text=message.message))
+        return await send_llm_message(system_prompt, message.message)
+
+    try:
+        # Identical questions against the same memory/task context share one upstream call
+        ai_response = await ai_response_cache.get_or_compute(ai_cache_key(message.message), generate_response)
         
         # Save this conversation to memory
         await db.ai_memory.insert_one({
@@ -490,6 +982,12 @@ Guidelines:
         })
         
         return {"response": ai_response, "success": True}
+    except AIBusyError:
+        logging.warning("AI Chat saturated, returning fallback response")
+        return {"response": "I'm handling a lot of requests right now. Please try again in a few seconds.", "success": False}
+    except asyncio.TimeoutError:
+        logging.error(f"AI Chat upstream timed out after {AI_UPSTREAM_TIMEOUT_SECONDS}s")
+        return {"response": "Sorry, the AI service took too long to respond. Please try again in a moment.", "success": False}
     except Exception as e:
         logging.error(f"AI Chat Error: {str(e)}")
         return {"response": f"I apologize, I'm having trouble connecting right now. Please try again in a moment. Error: {str(e)}", "success": False}
@@ -562,32 +1060,37 @@ async def create_article(article: ArticleCreate, _: bool = Depends(get_current_a
     doc['created_at'] = doc['created_at'].isoformat()
     doc['updated_at'] = doc['updated_at'].isoformat()
     await db.articles.insert_one(doc)
+    await refresh_static(export_articles, doc['id'])
     return {"success": True, "article": doc}
 
 @api_router.put("/articles/{article_id}")
 async def update_article(article_id: str, article_data: dict, _: bool = Depends(get_current_admin)):
     article_data['updated_at'] = datetime.now(timezone.utc).isoformat()
     await db.articles.update_one({"id": article_id}, {"$set": article_data})
+    await refresh_static(export_articles, article_id)
     return {"success": True, "message": "Article updated"}
 
 @api_router.delete("/articles/{article_id}")
 async def delete_article(article_id: str, _: bool = Depends(get_current_admin)):
     await db.articles.delete_one({"id": article_id})
+    await refresh_static(export_articles, article_id)
     return {"success": True, "message": "Article deleted"}
 
 @api_router.post("/articles/{article_id}/like")
-async def like_article(article_id: str):
-    await db.articles.update_one({"id": article_id}, {"$inc": {"likes": 1}})
+async def like_article(article_id: str, _: bool = Depends(public_write_admission("like"))):
+    async with write_backpressure.track():
+        await db.articles.update_one({"id": article_id}, {"$inc": {"likes": 1}})
     return {"success": True}
 
 @api_router.post("/articles/{article_id}/comment")
-async def add_comment(article_id: str, comment: Comment):
+async def add_comment(article_id: str, comment: Comment, _: bool = Depends(public_write_admission("comment"))):
     comment_dict = comment.model_dump()
     comment_dict['created_at'] = comment_dict['created_at'].isoformat()
-    await db.articles.update_one(
-        {"id": article_id},
-        {"$push": {"comments": comment_dict}}
-    )
+    async with write_backpressure.track():
+        await db.articles.update_one(
+            {"id": article_id},
+            {"$push": {"comments": comment_dict}}
+        )
     return {"success": True, "comment": comment_dict}
 
 # ==================== GALLERY ROUTES ====================
@@ -618,22 +1121,26 @@ async def upload_photo(photo: PhotoUpload, _: bool = Depends(get_current_admin))
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     await db.gallery.insert_one(new_photo)
+    await refresh_static(export_gallery)
     return {"success": True, "photo": new_photo}
 
 @api_router.put("/gallery/{photo_id}")
 async def update_photo(photo_id: str, photo_data: dict, _: bool = Depends(get_current_admin)):
     await db.gallery.update_one({"id": photo_id}, {"$set": photo_data})
+    await refresh_static(export_gallery)
     return {"success": True, "message": "Photo updated"}
 
 @api_router.put("/gallery/reorder")
 async def reorder_gallery(order_data: dict, _: bool = Depends(get_current_admin)):
     for photo_id, new_order in order_data.get('order', {}).items():
         await db.gallery.update_one({"id": photo_id}, {"$set": {"order": new_order}})
+    await refresh_static(export_gallery)
     return {"success": True, "message": "Gallery reordered"}
 
 @api_router.delete("/gallery/{photo_id}")
 async def delete_photo(photo_id: str, _: bool = Depends(get_current_admin)):
     await db.gallery.delete_one({"id": photo_id})
+    await refresh_static(export_gallery)
     return {"success": True, "message": "Photo deleted"}
 
 # ==================== NOTIFICATIONS ROUTES ====================
@@ -661,6 +1168,33 @@ async def delete_notification(notification_id: str, _: bool = Depends(get_curren
     await db.notifications.delete_one({"id": notification_id})
     return {"success": True}
 
+# ==================== BACKUP ROUTES ====================
+
+@api_router.get("/admin/backup")
+async def download_backup(_: bool = Depends(get_current_admin)):
+    filename = f"backup-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.ndjson.gz"
+    return StreamingResponse(
+        iter_backup_chunks(),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@api_router.post("/admin/restore")
+async def upload_restore(
+    request: Request,
+    batch_size: int = Query(BACKUP_BATCH_SIZE, ge=1),
+    parallelism: int = Query(BACKUP_PARALLELISM, ge=1),
+    drop: bool = False,
+    _: bool = Depends(get_current_admin)
+):
+    try:
+        counts = await restore_backup(request.stream(), batch_size, parallelism, drop)
+    except RestoreError as e:
+        logging.error(f"Restore failed: {str(e)}")
+        message = "Invalid backup archive" if e.status_code == 400 else "Restore failed"
+        raise HTTPException(status_code=e.status_code, detail={"message": f"{message}: {str(e)}", "committed": e.committed})
+    return {"success": True, "restored": counts}
+
 # ==================== STATS ROUTES ====================
 
 @api_router.get("/stats")
@@ -28,6 +28,8 @@ import { Skeleton } from "@/components/ui/skeleton";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || "";
 const API = BACKEND_URL + "/api";
+// Set at build time only when the public data was exported to /data (see `vercel-build`)
+const STATIC_DATA = process.env.REACT_APP_STATIC_DATA === "true";
 
 const PROFILE_PHOTO = "https://customer-assets.emergentagent.com/job_74a4d412-d036-4d55-a85a-57b8799f39c4/artifacts/5p9dxuwa_profile.png";
 
@@ -57,6 +59,15 @@ const api = {
     const url = token ? API + endpoint + "?token=" + token : API + endpoint;
     const response = await axios.delete(url);
     return response.data;
+  },
+  // Public reads try the statically exported JSON first and fall back to the API
+  getPublic: async (file, endpoint) => {
+    if (!STATIC_DATA) return api.get(endpoint);
+    try {
+      const response = await axios.get("/data/" + file);
+      if (response.data && typeof response.data === 'object') return response.data;
+    } catch {}
+    return api.get(endpoint);
   }
 };
 
@@ -316,7 +327,7 @@ const HomePage = () => {
   useEffect(() => {
     const fetchPortfolio = async () => {
       try {
-        const data = await api.get('/portfolio');
+        const data = await api.getPublic('portfolio.json', '/portfolio');
         data.avatar_url = PROFILE_PHOTO;
         setPortfolio(data);
       } catch (error) { console.error('Error:', error); }
@@ -508,7 +519,7 @@ const ArticlesPage = () => {
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    api.get('/articles?published_only=true').then(setArticles).catch(console.error).finally(() => setLoading(false));
+    api.getPublic('articles.json', '/articles?published_only=true').then(setArticles).catch(console.error).finally(() => setLoading(false));
   }, []);
 
   const handleLike = async (articleId) => {
@@ -566,6 +577,7 @@ const ArticlePage = () => {
   const [loading, setLoading] = useState(true);
   const [comment, setComment] = useState({ author_name: '', content: '' });
 
+  // Read from the API, not the static export: likes and comments change without a rebuild
   useEffect(() => {
     api.get("/articles/" + articleId).then(setArticle).catch(console.error).finally(() => setLoading(false));
   }, [articleId]);
@@ -625,7 +637,7 @@ const GalleryPage = () => {
   const [selectedPhoto, setSelectedPhoto] = useState(null);
 
   useEffect(() => {
-    api.get('/gallery?visible_only=true').then(setPhotos).catch(console.error).finally(() => setLoading(false));
+    api.getPublic('gallery.json', '/gallery?visible_only=true').then(setPhotos).catch(console.error).finally(() => setLoading(false));
   }, []);
 
   return (
@@ -0,0 +1,18 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Always run against the in-memory mock database
+os.environ.pop("MONGO_URL", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend import server  # noqa: E402
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    database = server.MockAsyncIOMotorClient()["test_db"]
+    monkeypatch.setattr(server, "db", database)
+    return database
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import server
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_token_bucket_refills_over_time(clock):
+    limiter = server.TokenBucketLimiter(max_keys=10, idle_seconds=600)
+
+    assert limiter.acquire("ip", capacity=2, refill_per_second=1) == 0
+    assert limiter.acquire("ip", capacity=2, refill_per_second=1) == 0
+    assert limiter.acquire("ip", capacity=2, refill_per_second=1) == pytest.approx(1)
+    clock[0] += 1
+    assert limiter.acquire("ip", capacity=2, refill_per_second=1) == 0
+
+
+def test_token_bucket_evicts_idle_and_overflow_keys(clock):
+    limiter = server.TokenBucketLimiter(max_keys=3, idle_seconds=60)
+    for key in range(5):
+        limiter.acquire(key, capacity=1, refill_per_second=1)
+    assert list(limiter.buckets) == [2, 3, 4]
+
+    clock[0] += 61
+    limiter.acquire("new", capacity=1, refill_per_second=1)
+    assert list(limiter.buckets) == ["new"]
+
+
+def test_backpressure_gates_on_inflight_and_recent_latency(clock):
+    gate = server.WriteBackpressure(max_inflight=2, max_latency_ms=100)
+    assert not gate.overloaded()
+
+    gate.inflight = 2
+    assert gate.overloaded()
+    gate.inflight = 0
+
+    gate.latency_ms = 500
+    gate.last_sample_at = clock[0]
+    assert gate.overloaded()
+    # Stale latency readings no longer keep the gate shut
+    clock[0] += gate.RECOVERY_SECONDS + 1
+    assert not gate.overloaded()
+
+
+def test_backpressure_track_counts_inflight():
+    gate = server.WriteBackpressure(max_inflight=10, max_latency_ms=100)
+
+    async def run():
+        async with gate.track():
+            assert gate.inflight == 1
+        return gate.inflight
+
+    assert asyncio.run(run()) == 0
+    assert gate.last_sample_at > 0
+
+
+def make_request(client_ip="10.0.0.1", forwarded_for=None):
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return server.Request({"type": "http", "headers": headers, "client": (client_ip, 1234)})
+
+
+@pytest.fixture
+def admit_like(monkeypatch):
+    monkeypatch.setattr(server, "RATE_LIMITS", {"like": "2/60"})
+    monkeypatch.setattr(server, "rate_limiter", server.TokenBucketLimiter(100, 600))
+    monkeypatch.setattr(server, "write_backpressure", server.WriteBackpressure(50, 500))
+    admit = server.public_write_admission("like")
+    return lambda request: asyncio.run(admit(request))
+
+
+def test_admission_rate_limits_per_client(admit_like):
+    assert admit_like(make_request()) is True
+    assert admit_like(make_request()) is True
+    with pytest.raises(server.HTTPException) as exc:
+        admit_like(make_request())
+    assert exc.value.status_code == 429
+    assert "Retry-After" in exc.value.headers
+    assert admit_like(make_request("10.0.0.2")) is True
+
+
+def test_spoofed_forwarded_for_does_not_reset_bucket(admit_like, monkeypatch):
+    monkeypatch.setattr(server, "TRUSTED_PROXY_HOPS", 0)
+    for _ in range(2):
+        admit_like(make_request())
+
+    with pytest.raises(server.HTTPException) as exc:
+        admit_like(make_request(forwarded_for="1.2.3.4"))
+    assert exc.value.status_code == 429
+
+
+def test_trusted_proxy_uses_right_most_forwarded_entry(monkeypatch):
+    monkeypatch.setattr(server, "TRUSTED_PROXY_HOPS", 1)
+
+    assert server.get_client_ip(make_request(forwarded_for="6.6.6.6, 203.0.113.7")) == "203.0.113.7"
+    assert server.get_client_ip(make_request()) == "10.0.0.1"
+
+
+def test_admission_rejects_when_db_overloaded(admit_like):
+    server.write_backpressure.inflight = 50
+
+    with pytest.raises(server.HTTPException) as exc:
+        admit_like(make_request())
+    assert exc.value.status_code == 503
+
+
+def test_like_route_is_admission_controlled(monkeypatch, mock_db):
+    monkeypatch.setattr(server, "write_backpressure", server.WriteBackpressure(0, 500))
+
+    response = TestClient(server.app).post("/api/articles/x/like")
+    assert response.status_code == 503
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from backend import server
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    cache = server.AIResponseCache(max_entries=10, ttl_seconds=5)
+    cache.set("k", "v")
+
+    assert cache.get("k") == "v"
+    now[0] += 6
+    assert cache.get("k") is None
+    assert "k" not in cache.entries
+
+
+def test_cache_evicts_least_recently_used():
+    cache = server.AIResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_coalesces_identical_inflight_requests():
+    cache = server.AIResponseCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def compute():
+        calls.append(True)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["answer"] * 5
+    assert len(calls) == 1
+    assert cache.inflight == {}
+
+
+def test_cache_does_not_store_failures():
+    cache = server.AIResponseCache(max_entries=10, ttl_seconds=60)
+
+    async def compute():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get_or_compute("k", compute))
+    assert cache.get("k") is None
+    assert cache.inflight == {}
+
+
+def test_cache_key_normalizes_message_and_tracks_context(monkeypatch):
+    monkeypatch.setattr(server, "context_versions", {"memory": 0, "tasks": 0})
+    key = server.ai_cache_key("  Hello   THERE ")
+
+    assert key == server.ai_cache_key("hello there")
+    server.bump_context_version("tasks")
+    assert key != server.ai_cache_key("hello there")
+
+
+def test_limiter_times_out_without_leaking_permits(monkeypatch):
+    monkeypatch.setattr(server, "AI_QUEUE_TIMEOUT_SECONDS", 0.01)
+
+    async def run():
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setattr(server, "ai_semaphore", semaphore)
+        await server.acquire_ai_slot()
+        with pytest.raises(server.AIBusyError):
+            await server.acquire_ai_slot()
+        semaphore.release()
+        await asyncio.sleep(0)
+        # The slot must still be available after the timed-out waiter gave up
+        await server.acquire_ai_slot()
+        semaphore.release()
+        return semaphore._value
+
+    assert asyncio.run(run()) == 1
+
+
+def test_late_acquire_is_released(monkeypatch):
+    async def run():
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setattr(server, "ai_semaphore", semaphore)
+        await semaphore.acquire()
+        acquired = asyncio.get_running_loop().create_future()
+        acquired.set_result(True)
+        server.release_if_acquired(acquired)
+        return semaphore._value
+
+    assert asyncio.run(run()) == 1
+
+
+class StubChat:
+    delay = 0
+
+    def __init__(self, **kwargs):
+        pass
+
+    def with_model(self, *args):
+        return self
+
+    async def send_message(self, message):
+        await asyncio.sleep(self.delay)
+        return "reply"
+
+
+@pytest.fixture
+def chat_env(monkeypatch, mock_db):
+    monkeypatch.setattr(server, "LlmChat", StubChat)
+    monkeypatch.setattr(server, "ai_response_cache", server.AIResponseCache(10, 60))
+    monkeypatch.setattr(server, "AI_QUEUE_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(server, "AI_UPSTREAM_TIMEOUT_SECONDS", 0.01)
+
+
+def test_chat_reports_saturation_as_busy(chat_env, monkeypatch):
+    async def run():
+        monkeypatch.setattr(server, "ai_semaphore", asyncio.Semaphore(0))
+        return await server.chat_with_ai(server.AIMessage(message="hi"), True)
+
+    result = asyncio.run(run())
+    assert result["success"] is False
+    assert "a lot of requests" in result["response"]
+
+
+def test_chat_reports_upstream_timeout_separately(chat_env, monkeypatch):
+    monkeypatch.setattr(StubChat, "delay", 1)
+
+    async def run():
+        monkeypatch.setattr(server, "ai_semaphore", asyncio.Semaphore(1))
+        return await server.chat_with_ai(server.AIMessage(message="hi"), True)
+
+    result = asyncio.run(run())
+    assert result["success"] is False
+    assert "took too long" in result["response"]
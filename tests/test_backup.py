@@ -0,0 +1,185 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from backend import server
+
+
+async def collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def stream(data: bytes, size: int = 7):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def seed(mock_db):
+    mock_db.data.update({
+        "portfolio": [{"id": "p1", "name": "Miryam"}],
+        "tasks": [{"id": f"t{i}", "title": f"Task {i}"} for i in range(25)],
+        "gallery": [{"id": "g1", "url": "x"}, {"id": "g2", "url": "y"}],
+    })
+
+
+def make_archive(records):
+    return gzip.compress(b"".join(json.dumps(r).encode() + b"\n" for r in records))
+
+
+@pytest.fixture(autouse=True)
+def no_static_refresh(monkeypatch):
+    async def refresh_static(*args):
+        pass
+    monkeypatch.setattr(server, "refresh_static", refresh_static)
+
+
+def test_backup_archive_is_gzip_ndjson(mock_db):
+    seed(mock_db)
+
+    archive = asyncio.run(collect(server.iter_backup_chunks()))
+    records = [json.loads(line) for line in gzip.decompress(archive).splitlines()]
+
+    assert len(records) == 28
+    assert records[0] == {"collection": "portfolio", "doc": {"id": "p1", "name": "Miryam"}}
+
+
+def test_round_trip_with_drop_replaces_data(mock_db):
+    seed(mock_db)
+    archive = asyncio.run(collect(server.iter_backup_chunks()))
+    mock_db.data["tasks"].append({"id": "extra", "title": "Not in backup"})
+    mock_db.data["notifications"] = [{"id": "n1"}]
+
+    counts = asyncio.run(server.restore_backup(stream(archive), batch_size=4, parallelism=2, drop=True))
+
+    assert counts["tasks"] == 25
+    assert len(mock_db.data["tasks"]) == 25
+    assert mock_db.data["notifications"] == []
+    assert not any(name.endswith("__restore") for name in mock_db.data)
+
+
+def test_restore_without_drop_upserts_by_id(mock_db):
+    seed(mock_db)
+    archive = asyncio.run(collect(server.iter_backup_chunks()))
+    mock_db.data["gallery"][0]["url"] = "changed"
+
+    asyncio.run(server.restore_backup(stream(archive), batch_size=10))
+
+    assert len(mock_db.data["gallery"]) == 2
+    assert len(mock_db.data["portfolio"]) == 1
+    assert len(mock_db.data["tasks"]) == 25
+    assert mock_db.data["gallery"][0]["url"] == "x"
+
+
+def test_invalid_archive_with_drop_keeps_existing_data(mock_db):
+    seed(mock_db)
+
+    with pytest.raises(server.RestoreError) as exc:
+        asyncio.run(server.restore_backup(stream(b"garbage"), drop=True))
+
+    assert exc.value.status_code == 400
+    assert exc.value.committed == {}
+    assert len(mock_db.data["tasks"]) == 25
+
+
+def test_unknown_collection_with_drop_keeps_existing_data(mock_db):
+    seed(mock_db)
+    archive = make_archive([
+        {"collection": "tasks", "doc": {"id": "new"}},
+        {"collection": "nope", "doc": {"id": "x"}},
+    ])
+
+    with pytest.raises(server.RestoreError):
+        asyncio.run(server.restore_backup(stream(archive), batch_size=1, drop=True))
+
+    assert len(mock_db.data["tasks"]) == 25
+    assert not any(name.endswith("__restore") for name in mock_db.data)
+
+
+@pytest.mark.parametrize("cut", [0, 10, -8, -1])
+def test_truncated_archive_with_drop_keeps_existing_data(mock_db, cut):
+    seed(mock_db)
+    archive = asyncio.run(collect(server.iter_backup_chunks()))
+
+    with pytest.raises(server.RestoreError) as exc:
+        asyncio.run(server.restore_backup(stream(archive[:cut]), batch_size=4, drop=True))
+
+    assert exc.value.status_code == 400
+    assert exc.value.committed == {}
+    assert len(mock_db.data["tasks"]) == 25
+    assert len(mock_db.data["gallery"]) == 2
+    assert not any(name.endswith("__restore") for name in mock_db.data)
+
+
+def test_archive_without_records_is_rejected(mock_db):
+    seed(mock_db)
+
+    with pytest.raises(server.RestoreError) as exc:
+        asyncio.run(server.restore_backup(stream(gzip.compress(b"")), drop=True))
+
+    assert exc.value.status_code == 400
+    assert len(mock_db.data["tasks"]) == 25
+
+
+def test_document_without_id_is_rejected(mock_db):
+    archive = make_archive([{"collection": "tasks", "doc": {"title": "no id"}}])
+
+    with pytest.raises(server.RestoreError) as exc:
+        asyncio.run(server.restore_backup(stream(archive)))
+    assert exc.value.status_code == 400
+
+
+def test_database_error_reports_committed_counts(mock_db, monkeypatch):
+    original = server.MockCollection.bulk_write
+
+    async def bulk_write(self, requests, *args, **kwargs):
+        if self.name == "gallery":
+            raise BulkWriteError({"writeErrors": []})
+        return await original(self, requests, *args, **kwargs)
+    monkeypatch.setattr(server.MockCollection, "bulk_write", bulk_write)
+    archive = make_archive([
+        {"collection": "tasks", "doc": {"id": "t1"}},
+        {"collection": "gallery", "doc": {"id": "g1"}},
+    ])
+
+    with pytest.raises(server.RestoreError) as exc:
+        asyncio.run(server.restore_backup(stream(archive), batch_size=1, parallelism=1))
+
+    assert exc.value.status_code == 500
+    assert exc.value.committed == {"tasks": 1}
+
+
+def test_restore_endpoint_reports_invalid_archive(mock_db, monkeypatch):
+    from fastapi.testclient import TestClient
+    monkeypatch.setitem(server.active_sessions, "test-token", True)
+    seed(mock_db)
+
+    response = TestClient(server.app).post("/api/admin/restore?token=test-token&drop=true", content=b"garbage")
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["committed"] == {}
+    assert len(mock_db.data["tasks"]) == 25
+
+
+def test_restore_endpoint_rejects_empty_body(mock_db, monkeypatch):
+    from fastapi.testclient import TestClient
+    monkeypatch.setitem(server.active_sessions, "test-token", True)
+    seed(mock_db)
+
+    response = TestClient(server.app).post("/api/admin/restore?token=test-token&drop=true", content=b"")
+
+    assert response.status_code == 400
+    assert len(mock_db.data["tasks"]) == 25
+    assert len(mock_db.data["portfolio"]) == 1
+
+
+@pytest.mark.parametrize("option", ["--batch-size", "--parallelism"])
+def test_cli_rejects_non_positive_restore_options(monkeypatch, option):
+    from backend import backup
+    monkeypatch.setattr("sys.argv", ["backup", "restore", "a.gz", option, "0"])
+
+    with pytest.raises(SystemExit) as exc:
+        backup.main()
+    assert exc.value.code == 2
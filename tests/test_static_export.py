@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from backend import server
+
+
+def test_export_articles_writes_list_and_article(tmp_path, mock_db):
+    mock_db.data["articles"] = [
+        {"id": "a1", "title": "One", "published": True},
+        {"id": "a2", "title": "Draft", "published": False},
+    ]
+
+    asyncio.run(server.export_articles("a1", out_dir=tmp_path))
+
+    assert [a["id"] for a in json.loads((tmp_path / "articles.json").read_text())] == ["a1"]
+    assert json.loads((tmp_path / "articles" / "a1.json").read_text())["title"] == "One"
+
+
+def test_export_articles_removes_unpublished_article(tmp_path, mock_db):
+    mock_db.data["articles"] = [{"id": "a1", "title": "One", "published": True}]
+    asyncio.run(server.export_articles("a1", out_dir=tmp_path))
+
+    mock_db.data["articles"][0]["published"] = False
+    asyncio.run(server.export_articles("a1", out_dir=tmp_path))
+
+    assert json.loads((tmp_path / "articles.json").read_text()) == []
+    assert not (tmp_path / "articles" / "a1.json").exists()
+
+
+def test_export_keeps_articles_beyond_list_cap(tmp_path, mock_db):
+    mock_db.data["articles"] = [{"id": f"a{i}", "published": True} for i in range(120)]
+
+    asyncio.run(server.export_all(tmp_path))
+    assert len(list((tmp_path / "articles").iterdir())) == 120
+
+    # Re-exporting an older article outside the list window must not delete its file
+    asyncio.run(server.export_articles("a110", out_dir=tmp_path))
+    assert (tmp_path / "articles" / "a110.json").exists()
+
+
+def test_export_all_drops_stale_article_files(tmp_path, mock_db):
+    (tmp_path / "articles").mkdir()
+    (tmp_path / "articles" / "gone.json").write_text("{}")
+    mock_db.data["articles"] = [{"id": "a1", "published": True}]
+
+    asyncio.run(server.export_all(tmp_path))
+
+    assert sorted(p.name for p in (tmp_path / "articles").iterdir()) == ["a1.json"]
+    assert (tmp_path / "portfolio.json").exists()
+    assert (tmp_path / "gallery.json").exists()
+
+
+def test_refresh_static_never_raises(monkeypatch):
+    async def broken():
+        raise OSError("read-only file system")
+    monkeypatch.setattr(server, "STATIC_EXPORT_ENABLED", True)
+
+    asyncio.run(server.refresh_static(broken))
+
+
+def test_refresh_static_disabled_skips_export(monkeypatch):
+    calls = []
+    async def exporter():
+        calls.append(True)
+    monkeypatch.setattr(server, "STATIC_EXPORT_ENABLED", False)
+
+    asyncio.run(server.refresh_static(exporter))
+
+    assert calls == []
+
+
+def test_like_and_comment_do_not_refresh_static(monkeypatch, mock_db):
+    calls = []
+    async def refresh_static(*args):
+        calls.append(args)
+    monkeypatch.setattr(server, "refresh_static", refresh_static)
+    client = TestClient(server.app)
+
+    assert client.post("/api/articles/x/like").status_code == 200
+    assert client.post("/api/articles/x/comment", json={"author_name": "a", "content": "b"}).status_code == 200
+    assert calls == []